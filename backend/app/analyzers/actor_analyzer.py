@@ -5,6 +5,8 @@ from typing import Dict
 
 
 class ActorRepresentationAnalyzer:
+    __slots__ = ('colonial_entities', 'native_entities')
+    
     def __init__(self):
         self.colonial_entities = self._load_colonial_entity_list()
         self.native_entities = self._load_native_entity_list()
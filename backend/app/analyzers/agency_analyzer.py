@@ -2,278 +2,460 @@
 Analyzer for passive voice and agency erasure patterns
 """
 
-from typing import Dict, List, Tuple
+import re
+from typing import Dict, Final, FrozenSet, Iterator, List, Set, Tuple
+import ahocorasick
+import numpy as np
 import spacy
+from spacy.attrs import DEP, HEAD, POS
+from spacy.strings import get_string_id
+from spacy.symbols import (
+    VERB,
+    agent as AGENT,
+    auxpass as AUXPASS,
+    nsubj as NSUBJ,
+    nsubjpass as NSUBJPASS,
+    pobj as POBJ,
+    prep as PREP,
+)
+
+from app.analyzers.spacy_cache import get_nlp, get_sentencizer
+from app.core.config import settings
+
+# Bit flags tagging which term set(s) a matched keyword belongs to
+VIOLENCE = 1
+RESISTANCE = 2
+COLONIAL_ACTOR = 4
+NATIVE_ACTOR = 8
+
+# Hash of the lowercase form "by", compared against Token.lower
+BY = get_string_id("by")
+
+# Violence-related terms that might be passive
+VIOLENCE_TERMS: Final[FrozenSet[str]] = frozenset(
+    {
+        "killed",
+        "murdered",
+        "massacred",
+        "executed",
+        "slaughtered",
+        "tortured",
+        "beaten",
+        "arrested",
+        "imprisoned",
+        "detained",
+        "suppressed",
+        "oppressed",
+        "exploited",
+        "enslaved",
+        "displaced",
+        "attacked",
+        "invaded",
+        "conquered",
+        "colonized",
+        "occupied",
+        "destroyed",
+        "burned",
+        "raided",
+        "pillaged",
+        "plundered",
+    }
+)
+
+# Resistance terms (often active voice for natives)
+RESISTANCE_TERMS: Final[FrozenSet[str]] = frozenset(
+    {
+        "resisted",
+        "fought",
+        "rebelled",
+        "revolted",
+        "uprising",
+        "attacked",
+        "defended",
+        "protested",
+        "opposed",
+        "challenged",
+    }
+)
+
+# Colonial actors
+COLONIAL_ACTORS: Final[FrozenSet[str]] = frozenset(
+    {
+        "british",
+        "french",
+        "spanish",
+        "portuguese",
+        "dutch",
+        "belgian",
+        "italian",
+        "german",
+        "colonial",
+        "european",
+        "empire",
+        "colonial forces",
+        "troops",
+        "soldiers",
+        "administration",
+        "authorities",
+        "government",
+        "colonizers",
+        "settlers",
+        "colonial power",
+    }
+)
+
+# Native actors
+NATIVE_ACTORS: Final[FrozenSet[str]] = frozenset(
+    {
+        "natives",
+        "indigenous",
+        "local",
+        "tribal",
+        "resistance",
+        "rebels",
+        "fighters",
+        "population",
+        "people",
+        "inhabitants",
+        "villagers",
+        "community",
+    }
+)
+
+
+# Nominalization patterns (verbs turned to nouns)
+NOMINALIZATION_PATTERNS: Final[Dict[str, str]] = {
+    "violence occurred": "violence",
+    "conflict arose": "conflict",
+    "resistance happened": "resistance",
+    "oppression took place": "oppression",
+    "exploitation existed": "exploitation",
+    "massacre took place": "massacre",
+    "rebellion broke out": "rebellion",
+}
+
+
+def _build_term_automaton() -> ahocorasick.Automaton:
+    """
+    Build an Aho-Corasick automaton mapping each term to its set flags
+    """
+    flags: Dict[str, int] = {}
+    for terms, flag in (
+        (VIOLENCE_TERMS, VIOLENCE),
+        (RESISTANCE_TERMS, RESISTANCE),
+        (COLONIAL_ACTORS, COLONIAL_ACTOR),
+        (NATIVE_ACTORS, NATIVE_ACTOR),
+    ):
+        for term in terms:
+            flags[term] = flags.get(term, 0) | flag
+
+    automaton = ahocorasick.Automaton()
+    for term, flag in flags.items():
+        automaton.add_word(term, flag)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_nominalization_triggers() -> Dict[str, Set[str]]:
+    """
+    Map each nominalization phrase or noun to the patterns it triggers
+    """
+    triggers: Dict[str, Set[str]] = {}
+    for pattern, noun in NOMINALIZATION_PATTERNS.items():
+        triggers.setdefault(pattern, set()).add(pattern)
+        triggers.setdefault(noun, set()).add(pattern)
+    return triggers
+
+
+# Single automaton over every term set, so each sentence is scanned once
+TERM_AUTOMATON: Final = _build_term_automaton()
+
+# All nominalization triggers in one alternation. The lookahead lets matches
+# overlap, so a trigger inside another one is not skipped.
+NOMINALIZATION_TRIGGERS: Final = _build_nominalization_triggers()
+NOMINALIZATION_RE: Final = re.compile(
+    "(?=("
+    + "|".join(
+        re.escape(t) for t in sorted(NOMINALIZATION_TRIGGERS, key=len, reverse=True)
+    )
+    + "))"
+)
 
 
 class AgencyAnalyzer:
+    __slots__ = ("nlp", "nlp_sbd")
+
+    # Shared, immutable term tables
+    violence_terms = VIOLENCE_TERMS
+    resistance_terms = RESISTANCE_TERMS
+    colonial_actors = COLONIAL_ACTORS
+    native_actors = NATIVE_ACTORS
+    nominalization_patterns = NOMINALIZATION_PATTERNS
+
     def __init__(self):
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            # Only dependency labels, POS tags and sentence boundaries are used
+            self.nlp = get_nlp(settings.SPACY_MODEL_STRUCTURAL, ("ner", "lemmatizer"))
         except OSError:
             # Fallback if model not installed
             self.nlp = None
 
-        # Violence-related terms that might be passive
-        self.violence_terms = {
-            "killed",
-            "murdered",
-            "massacred",
-            "executed",
-            "slaughtered",
-            "tortured",
-            "beaten",
-            "arrested",
-            "imprisoned",
-            "detained",
-            "suppressed",
-            "oppressed",
-            "exploited",
-            "enslaved",
-            "displaced",
-            "attacked",
-            "invaded",
-            "conquered",
-            "colonized",
-            "occupied",
-            "destroyed",
-            "burned",
-            "raided",
-            "pillaged",
-            "plundered",
-        }
-
-        # Resistance terms (often active voice for natives)
-        self.resistance_terms = {
-            "resisted",
-            "fought",
-            "rebelled",
-            "revolted",
-            "uprising",
-            "attacked",
-            "defended",
-            "protested",
-            "opposed",
-            "challenged",
-        }
-
-        # Nominalization patterns (verbs turned to nouns)
-        self.nominalization_patterns = {
-            "violence occurred": "violence",
-            "conflict arose": "conflict",
-            "resistance happened": "resistance",
-            "oppression took place": "oppression",
-            "exploitation existed": "exploitation",
-            "massacre took place": "massacre",
-            "rebellion broke out": "rebellion",
-        }
-
-        # Colonial actors
-        self.colonial_actors = {
-            "british",
-            "french",
-            "spanish",
-            "portuguese",
-            "dutch",
-            "belgian",
-            "italian",
-            "german",
-            "colonial",
-            "european",
-            "empire",
-            "colonial forces",
-            "troops",
-            "soldiers",
-            "administration",
-            "authorities",
-            "government",
-            "colonizers",
-            "settlers",
-            "colonial power",
-        }
+        # Cheap rule-based sentence splitting for the prefilter pass
+        self.nlp_sbd = get_sentencizer()
 
-        # Native actors
-        self.native_actors = {
-            "natives",
-            "indigenous",
-            "local",
-            "tribal",
-            "natives",
-            "resistance",
-            "rebels",
-            "fighters",
-            "population",
-            "people",
-            "inhabitants",
-            "villagers",
-            "community",
-        }
+    def _scan_terms(self, text_lower: str) -> int:
+        """
+        Return the OR of the set flags of every term found in the text
+        """
+        found = 0
+        for _, flag in TERM_AUTOMATON.iter(text_lower):
+            found |= flag
+        return found
 
     def analyze_agency(self, text: str) -> Dict:
         """
         Detect patterns of agency erasure through passive voice
         """
-        patterns = {
-            "passive_violence": [],
-            "active_resistance": [],
-            "nominalization": [],
-            "agent_deletion": [],
-        }
+        return next(self.analyze_agency_batch([text]))
+
+    def analyze_agency_batch(
+        self,
+        texts: List[str],
+        batch_size: int = settings.ANALYZER_BATCH_SIZE,
+        n_process: int = settings.ANALYZER_N_PROCESS,
+    ) -> Iterator[Dict]:
+        """
+        Detect agency erasure patterns in many texts, batching them through spaCy
 
-        statistics = {
-            "total_violence_references": 0,
-            "passive_violence_pct": 0.0,
-            "agent_deletion_pct": 0.0,
-            "native_active_violence_pct": 0.0,
-        }
+        Sentences are split by a rule-based sentencizer and prefiltered by the
+        term scan, so only sentences mentioning violence or resistance are
+        sent through the dependency parser.
+        """
+        results = [self._new_result() for _ in texts]
+
+        if self.nlp:
+            candidates = []
+            for index, doc in enumerate(
+                self.nlp_sbd.pipe(texts, batch_size=batch_size)
+            ):
+                candidates.extend(
+                    (sent_text, (index, found))
+                    for sent_text, found in self._prefilter_sentences(
+                        doc, results[index]
+                    )
+                )
+
+            parsed = self.nlp.pipe(
+                candidates, as_tuples=True, batch_size=batch_size, n_process=n_process
+            )
+            for sent_doc, (index, found) in parsed:
+                self._analyze_sentence(sent_doc, found, results[index])
 
-        if not self.nlp:
-            return {"patterns": patterns, "statistics": statistics}
+        for result in results:
+            yield self._finalize_result(result)
 
-        doc = self.nlp(text)
+    def _new_result(self) -> Dict:
+        """
+        Empty pattern lists and counters for one text
+        """
+        return {
+            "patterns": {
+                "passive_violence": [],
+                "active_resistance": [],
+                "nominalization": [],
+                "agent_deletion": [],
+            },
+            "counts": {
+                "violence": 0,
+                "passive_violence": 0,
+                "agent_deletion": 0,
+                "native_active_violence": 0,
+            },
+        }
 
-        # Analyze sentences
-        violence_count = 0
-        passive_violence_count = 0
-        agent_deletion_count = 0
-        native_active_violence_count = 0
+    def _prefilter_sentences(
+        self, doc: spacy.tokens.Doc, result: Dict
+    ) -> List[Tuple[str, int]]:
+        """
+        Scan each sentence for terms and nominalizations, returning the
+        (text, term flags) of sentences that need a dependency parse
+        """
+        candidates = []
 
         for sent in doc.sents:
             sent_text = sent.text.strip()
+            sent_lower = sent_text.lower()
 
-            # Check for violence terms
-            has_violence = any(
-                term in sent_text.lower() for term in self.violence_terms
-            )
-            has_resistance = any(
-                term in sent_text.lower() for term in self.resistance_terms
-            )
+            # Check for violence and resistance terms in a single pass
+            found = self._scan_terms(sent_lower)
+
+            # Counted per sentencizer sentence, not per parser sentence as
+            # before the prefilter; the two can split text differently, so
+            # total_violence_references may differ slightly from older results
+            if found & VIOLENCE:
+                result["counts"]["violence"] += 1
+
+            if found & (VIOLENCE | RESISTANCE):
+                candidates.append((sent_text, found))
 
-            if has_violence:
-                violence_count += 1
+            # Check for nominalization
+            nominalizations = self._detect_nominalization(sent_lower)
+            if nominalizations:
+                result["patterns"]["nominalization"].extend(
+                    [{"text": sent_text, "pattern": nom} for nom in nominalizations]
+                )
 
-                # Check if passive voice
-                is_passive, actor = self._is_passive_construction(sent)
+        return candidates
 
-                if is_passive:
-                    passive_violence_count += 1
-                    patterns["passive_violence"].append(
-                        {"text": sent_text, "actor": actor}
+    def _analyze_sentence(
+        self, sent_doc: spacy.tokens.Doc, found: int, result: Dict
+    ) -> None:
+        """
+        Check voice and agency in one parsed candidate sentence
+        """
+        patterns = result["patterns"]
+        counts = result["counts"]
+        sent = sent_doc[:]
+        sent_text = sent_doc.text.strip()
+
+        # One (DEP, POS, head POS) row per token.
+        # HEAD is exported as a relative offset; swap it for the head's POS.
+        sent_attrs = sent_doc.to_array([DEP, POS, HEAD])
+        heads = np.arange(len(sent_doc)) + sent_attrs[:, 2].astype(np.int64)
+        sent_attrs[:, 2] = sent_attrs[heads, 1]
+
+        has_violence = bool(found & VIOLENCE)
+        has_native = bool(found & NATIVE_ACTOR)
+        has_resistance = bool(found & RESISTANCE)
+
+        if has_violence:
+            # Check if passive voice
+            is_passive, actor = self._is_passive_construction(sent, sent_attrs)
+
+            if is_passive:
+                counts["passive_violence"] += 1
+                patterns["passive_violence"].append({"text": sent_text, "actor": actor})
+
+                if not actor:
+                    counts["agent_deletion"] += 1
+                    patterns["agent_deletion"].append(
+                        {"text": sent_text, "type": "violence"}
                     )
 
-                    if not actor:
-                        agent_deletion_count += 1
-                        patterns["agent_deletion"].append(
-                            {"text": sent_text, "type": "violence"}
-                        )
+            # Check if native is active subject committing violence
+            if self._has_native_active_violence(
+                sent, sent_attrs, has_native, has_violence
+            ):
+                counts["native_active_violence"] += 1
 
-                # Check if native is active subject committing violence
-                if self._has_native_active_violence(sent):
-                    native_active_violence_count += 1
+        if has_resistance:
+            # Check if active voice for resistance
+            is_active = self._is_active_construction(sent_attrs)
+            if is_active:
+                patterns["active_resistance"].append({"text": sent_text})
 
-            if has_resistance:
-                # Check if active voice for resistance
-                is_active = self._is_active_construction(sent)
-                if is_active:
-                    patterns["active_resistance"].append({"text": sent_text})
+    def _finalize_result(self, result: Dict) -> Dict:
+        """
+        Turn the counters for one text into percentage statistics
+        """
+        counts = result["counts"]
+        violence_count = counts["violence"]
 
-            # Check for nominalization
-            nominalizations = self._detect_nominalization(sent_text)
-            if nominalizations:
-                patterns["nominalization"].extend(
-                    [{"text": sent_text, "pattern": nom} for nom in nominalizations]
-                )
+        statistics = {
+            "total_violence_references": violence_count,
+            "passive_violence_pct": 0.0,
+            "agent_deletion_pct": 0.0,
+            "native_active_violence_pct": 0.0,
+        }
 
-        # Calculate statistics
-        statistics["total_violence_references"] = violence_count
         if violence_count > 0:
             statistics["passive_violence_pct"] = (
-                passive_violence_count / violence_count
+                counts["passive_violence"] / violence_count
             ) * 100
             statistics["agent_deletion_pct"] = (
-                agent_deletion_count / violence_count
+                counts["agent_deletion"] / violence_count
             ) * 100
             statistics["native_active_violence_pct"] = (
-                native_active_violence_count / violence_count
+                counts["native_active_violence"] / violence_count
             ) * 100
 
-        return {"patterns": patterns, "statistics": statistics}
+        return {"patterns": result["patterns"], "statistics": statistics}
 
-    def _is_passive_construction(self, sent) -> Tuple[bool, str]:
+    def _is_passive_construction(
+        self, sent, sent_attrs: np.ndarray
+    ) -> Tuple[bool, str]:
         """
         Check if sentence uses passive voice
         Returns (is_passive, actor_if_found)
         """
         actor = None
-        is_passive = False
-
-        for token in sent:
-            # Check for passive auxiliary + past participle
-            if token.dep_ == "auxpass":
-                is_passive = True
-
-                # Look for agent in "by" phrase
-                for child in token.head.children:
-                    if child.dep_ == "agent" or (
-                        child.dep_ == "prep" and child.text.lower() == "by"
-                    ):
-                        for subchild in child.children:
-                            if subchild.dep_ == "pobj":
-                                actor = subchild.text
-                                break
+
+        # Check for passive auxiliary + past participle
+        auxpass_idx = np.flatnonzero(sent_attrs[:, 0] == AUXPASS)
+        is_passive = auxpass_idx.size > 0
+
+        for i in auxpass_idx:
+            token = sent[int(i)]
+
+            # Look for agent in "by" phrase
+            for child in token.head.children:
+                if child.dep == AGENT or (child.dep == PREP and child.lower == BY):
+                    for subchild in child.children:
+                        if subchild.dep == POBJ:
+                            actor = subchild.text
+                            break
 
         return is_passive, actor
 
-    def _is_active_construction(self, sent) -> bool:
+    def _is_active_construction(self, sent_attrs: np.ndarray) -> bool:
         """
         Check if sentence uses active voice with clear subject
         """
-        has_subject = False
-        has_verb = False
+        deps = sent_attrs[:, 0]
+        pos = sent_attrs[:, 1]
 
-        for token in sent:
-            if token.dep_ in ["nsubj", "nsubjpass"]:
-                has_subject = True
-            if token.pos_ == "VERB" and token.dep_ not in ["auxpass"]:
-                has_verb = True
+        has_subject = np.any((deps == NSUBJ) | (deps == NSUBJPASS))
+        has_verb = np.any((pos == VERB) & (deps != AUXPASS))
 
-        return has_subject and has_verb
+        return bool(has_subject and has_verb)
 
-    def _has_native_active_violence(self, sent) -> bool:
+    def _has_native_active_violence(
+        self, sent, sent_attrs: np.ndarray, has_native: bool, has_violence: bool
+    ) -> bool:
         """
         Check if native actors are portrayed as active agents of violence
-        """
-        sent_text = sent.text.lower()
-
-        has_native = any(actor in sent_text for actor in self.native_actors)
-        has_violence = any(term in sent_text for term in self.violence_terms)
 
+        has_native and has_violence come from the caller's term scan of the
+        sentence, so the text is not searched again here.
+        """
         if not (has_native and has_violence):
             return False
 
+        native_actors = NATIVE_ACTORS
+        violence_terms = VIOLENCE_TERMS
+
+        # Only nominal subjects of a verb can be native agents of violence
+        candidates = np.flatnonzero(
+            (sent_attrs[:, 0] == NSUBJ) & (sent_attrs[:, 2] == VERB)
+        )
+
         # Check if native is subject of violence verb
-        for token in sent:
-            if token.dep_ in ["nsubj"] and any(
-                actor in token.text.lower() for actor in self.native_actors
+        for i in candidates:
+            token = sent[int(i)]
+            if any(actor in token.lower_ for actor in native_actors) and any(
+                term in token.head.lower_ for term in violence_terms
             ):
-                # Check if this subject is doing violence
-                head = token.head
-                if head.pos_ == "VERB" and any(
-                    term in head.text.lower() for term in self.violence_terms
-                ):
-                    return True
+                return True
 
         return False
 
-    def _detect_nominalization(self, text: str) -> List[str]:
+    def _detect_nominalization(self, text_lower: str) -> List[str]:
         """
-        Detect nominalization patterns that obscure agency
+        Detect nominalization patterns that obscure agency in lowercased text
         """
-        found = []
-        text_lower = text.lower()
+        matched: Set[str] = set()
+        for trigger in NOMINALIZATION_RE.findall(text_lower):
+            matched |= NOMINALIZATION_TRIGGERS[trigger]
 
-        for pattern, noun in self.nominalization_patterns.items():
-            if pattern in text_lower or noun in text_lower:
-                found.append(pattern)
-
-        return found
+        # Keep the declaration order of the patterns
+        return [p for p in NOMINALIZATION_PATTERNS if p in matched]
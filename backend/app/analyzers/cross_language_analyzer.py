@@ -5,6 +5,8 @@ from typing import Dict
 
 
 class CrossLanguageAnalyzer:
+    __slots__ = ()
+    
     def __init__(self):
         pass
     
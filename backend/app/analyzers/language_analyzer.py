@@ -1,25 +1,75 @@
 """
 Analyzer for detecting colonial language patterns
 """
+import json
+from pathlib import Path
 from typing import Dict, List
 
+import ahocorasick
+
+LEXICON_PATH = Path(__file__).resolve().parent.parent / 'data' / 'colonial_lexicon.json'
+
 
 class ColonialLanguageDetector:
+    __slots__ = ('colonial_lexicon', '_automaton')
+    
     def __init__(self):
         self.colonial_lexicon = self._load_colonial_lexicon()
+        self._automaton = self._build_automaton()
     
     def analyze_language(self, text: str) -> List[Dict]:
         """
         Detect colonial terminology and suggest alternatives
         """
         findings = []
+        text_lower = self._fold_case(text)
         
-        # Implementation will be added
+        for end, (term, entry) in self._automaton.iter(text_lower):
+            start = end - len(term) + 1
+            
+            # Only match at the start of a word ("tribe" but not "diatribe")
+            if start > 0 and text_lower[start - 1].isalpha():
+                continue
+            
+            findings.append({
+                'term': term,
+                'position': start,
+                'category': entry.get('category'),
+                'severity': entry.get('severity'),
+                'alternatives': entry.get('alternatives', []),
+                'explanation': entry.get('explanation')
+            })
         
         return findings
     
+    @staticmethod
+    def _fold_case(text: str) -> str:
+        """
+        Lowercase text without changing its length, so match offsets index the original
+        """
+        text_lower = text.lower()
+        if len(text_lower) == len(text):
+            return text_lower
+        
+        # Some characters ("İ") lowercase to several code points; leave those as
+        # they are so every later offset still lines up with the caller's text
+        return ''.join(
+            c_lower if len(c_lower := c.lower()) == 1 else c for c in text
+        )
+    
     def _load_colonial_lexicon(self) -> Dict:
         """
         Comprehensive database of colonial terminology
         """
-        return {}
+        with open(LEXICON_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _build_automaton(self) -> ahocorasick.Automaton:
+        """
+        Build an Aho-Corasick automaton over every lexicon term
+        """
+        automaton = ahocorasick.Automaton()
+        for term, entry in self.colonial_lexicon.items():
+            automaton.add_word(term.lower(), (term.lower(), entry))
+        automaton.make_automaton()
+        return automaton
@@ -5,6 +5,8 @@ from typing import Dict, List
 
 
 class ProvenanceScorer:
+    __slots__ = ('colonial_periods', 'native_institutions', 'colonial_institutions')
+    
     def __init__(self):
         self.colonial_periods = self._load_colonial_periods()
         self.native_institutions = self._load_native_institutions()
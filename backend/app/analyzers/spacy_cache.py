@@ -0,0 +1,27 @@
+"""
+Process-wide cache of loaded spaCy pipelines
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+import spacy
+from spacy.language import Language
+
+
+@lru_cache(maxsize=None)
+def get_nlp(model_name: str, disable: Tuple[str, ...] = ()) -> Language:
+    """
+    Load a spaCy pipeline once and share it across analyzer instances
+    """
+    return spacy.load(model_name, disable=list(disable))
+
+
+@lru_cache(maxsize=None)
+def get_sentencizer(lang: str = "en") -> Language:
+    """
+    Blank pipeline with only a rule-based sentencizer, for fast sentence splits
+    """
+    nlp = spacy.blank(lang)
+    nlp.add_pipe("sentencizer")
+    return nlp
@@ -1,7 +1,10 @@
 """
 Analysis endpoints for Wikipedia article evaluation
 """
-from fastapi import APIRouter, HTTPException
+import json
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 
 from app.models.schemas import (
@@ -9,20 +12,17 @@ from app.models.schemas import (
     AnalysisResponse,
     ArticleInfo
 )
-from app.services.wikipedia_service import WikipediaService
-from app.services.analysis_orchestrator import AnalysisOrchestrator
 
 router = APIRouter()
 
-wikipedia_service = WikipediaService()
-analysis_orchestrator = AnalysisOrchestrator()
-
 
 @router.post("/analyze", response_model=AnalysisResponse)
-async def analyze_article(request: AnalysisRequest):
+async def analyze_article(request: AnalysisRequest, req: Request):
     """
     Analyze a Wikipedia article for colonial bias
     """
+    wikipedia_service = req.app.state.wikipedia_service
+    analysis_orchestrator = req.app.state.analysis_orchestrator
     try:
         # Fetch article data
         article_data = await wikipedia_service.fetch_article(
@@ -39,25 +39,54 @@ async def analyze_article(request: AnalysisRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/analyze/stream")
+async def analyze_article_stream(request: AnalysisRequest, req: Request):
+    """
+    Analyze a Wikipedia article, streaming each dimension as a Server-Sent Event
+    """
+    wikipedia_service = req.app.state.wikipedia_service
+    analysis_orchestrator = req.app.state.analysis_orchestrator
+    try:
+        article_data = await wikipedia_service.fetch_article(
+            title=request.article_title,
+            languages=request.languages
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    async def events():
+        try:
+            async for name, score in analysis_orchestrator.analyze_stream(article_data):
+                payload = json.dumps({name: score.model_dump(mode="json")})
+                yield f"data: {payload}\n\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band and end
+            # the stream instead of dropping the connection
+            payload = json.dumps({"detail": str(e)})
+            yield f"event: error\ndata: {payload}\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/article-info/{title}", response_model=ArticleInfo)
-async def get_article_info(title: str):
+async def get_article_info(title: str, req: Request):
     """
     Get basic information about a Wikipedia article
     """
     try:
-        info = await wikipedia_service.get_article_info(title)
+        info = await req.app.state.wikipedia_service.get_article_info(title)
         return info
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Article not found: {str(e)}")
 
 
 @router.get("/available-languages/{title}")
-async def get_available_languages(title: str):
+async def get_available_languages(title: str, req: Request):
     """
     Get list of available language versions for an article
     """
     try:
-        languages = await wikipedia_service.get_available_languages(title)
+        languages = await req.app.state.wikipedia_service.get_available_languages(title)
         return {"languages": languages}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -22,7 +22,7 @@ async def query_graph(request: GraphQueryRequest):
     Query knowledge graph with various filters
     """
     try:
-        result = await graph_query_service.query(request)
+        result = graph_query_service.query(request)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -32,15 +32,13 @@ async def query_graph(request: GraphQueryRequest):
 async def get_nodes(
     topic: Optional[str] = None,
     group: Optional[int] = None,
-    limit: int = Query(default=100, le=1000),
+    limit: int = Query(default=100, ge=0, le=1000),
 ):
     """
     Get nodes with optional filtering
     """
     try:
-        nodes = await graph_query_service.get_nodes(
-            topic=topic, group=group, limit=limit
-        )
+        nodes = graph_query_service.get_nodes(topic=topic, group=group, limit=limit)
         return nodes
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -52,7 +50,7 @@ async def get_node(node_id: str):
     Get a specific node by ID
     """
     try:
-        node = await graph_query_service.get_node_by_id(node_id)
+        node = graph_query_service.get_node_by_id(node_id)
         if not node:
             raise HTTPException(status_code=404, detail=f"Node {node_id} not found")
         return node
@@ -70,7 +68,7 @@ async def get_node_neighbors(
     Get neighboring nodes for a specific node
     """
     try:
-        neighbors = await graph_query_service.get_neighbors(node_id, max_depth)
+        neighbors = graph_query_service.get_neighbors(node_id, max_depth)
         return neighbors
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -80,13 +78,13 @@ async def get_node_neighbors(
 async def get_edges(
     node_id: Optional[str] = None,
     min_similarity: float = Query(default=0.0, ge=0, le=1),
-    limit: int = Query(default=100, le=1000),
+    limit: int = Query(default=100, ge=0, le=1000),
 ):
     """
     Get edges with optional filtering
     """
     try:
-        edges = await graph_query_service.get_edges(
+        edges = graph_query_service.get_edges(
             node_id=node_id, min_similarity=min_similarity, limit=limit
         )
         return edges
@@ -100,7 +98,7 @@ async def get_full_graph(topic: Optional[str] = None, include_metadata: bool = T
     Get complete graph data (nodes and edges)
     """
     try:
-        graph = await graph_query_service.get_full_graph(
+        graph = graph_query_service.get_full_graph(
             topic=topic, include_metadata=include_metadata
         )
         return graph
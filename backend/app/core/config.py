@@ -2,11 +2,14 @@
 Application configuration
 """
 
-from pydantic_settings import BaseSettings
+from pydantic import AliasChoices, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
+
     # API Settings
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Decolonial Fact Checker"
@@ -24,16 +27,22 @@ class Settings(BaseSettings):
     WIKIPEDIA_USER_AGENT: str = "DecolonialFactChecker/1.0"
 
     # NLP Models
-    SPACY_MODEL_EN: str = "en_core_web_trf"
+    # Dependency labels, POS tags and sentence boundaries only need the small
+    # model; the transformer is reserved for entity recognition
+    SPACY_MODEL_STRUCTURAL: str = "en_core_web_sm"
+    # Reserved for entity recognition; no analyzer reads it yet. SPACY_MODEL_EN
+    # (which shipped as en_core_web_trf) is accepted as its legacy name
+    SPACY_MODEL_NER: str = Field(
+        default="en_core_web_trf",
+        validation_alias=AliasChoices("SPACY_MODEL_NER", "SPACY_MODEL_EN"),
+    )
     SPACY_MODEL_MULTILINGUAL: str = "xx_ent_wiki_sm"
+    ANALYZER_BATCH_SIZE: int = 64
+    ANALYZER_N_PROCESS: int = 1  # -1 uses every CPU for bulk analysis
 
     # Analysis Settings
     PASSIVE_VIOLENCE_THRESHOLD: float = 0.3
     COLONIAL_LANGUAGE_SEVERITY_WEIGHTS: dict = {"high": 1.0, "medium": 0.5, "low": 0.2}
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-
 
 settings = Settings()
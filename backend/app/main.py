@@ -2,16 +2,31 @@
 Main FastAPI application entry point
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.routes import analysis, graph
 from app.core.config import settings
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+from app.services.wikipedia_service import WikipediaService
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build services once per worker at startup instead of at import time
+    app.state.wikipedia_service = WikipediaService()
+    app.state.analysis_orchestrator = AnalysisOrchestrator()
+    yield
+
 
 app = FastAPI(
     title="Decolonial Fact Checker API",
     description="API for analyzing Wikipedia articles through a decolonial lens",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware - allow all origins for development
@@ -23,6 +38,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (analysis patterns, graph node/edge lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(analysis.router, prefix="/api/v1", tags=["analysis"])
 app.include_router(graph.router, prefix="/api/v1/graph", tags=["graph"])
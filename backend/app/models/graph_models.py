@@ -2,13 +2,16 @@
 Graph-specific data models
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional, Any, Union
 
 
 class GraphNode(BaseModel):
     """Node in the knowledge graph"""
 
+    # Instances are shared between cached query results, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     id: str
     label: str
     content: Optional[str] = None
@@ -28,6 +31,8 @@ class GraphNode(BaseModel):
 class GraphEdge(BaseModel):
     """Edge in the knowledge graph"""
 
+    model_config = ConfigDict(frozen=True)
+
     source: str = Field(..., description="Source node ID")
     target: str = Field(..., description="Target node ID")
     similarity: float = Field(..., ge=0, le=1, description="Similarity score")
@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
+from app.models.graph_models import KnowledgeGraphData
+
 
 class AnalysisRequest(BaseModel):
     """Request for article analysis"""
@@ -58,47 +60,6 @@ class AnalysisResponse(BaseModel):
     knowledge_graph_summary: Dict[str, Any] = Field(default_factory=dict)
 
 
-class GraphNode(BaseModel):
-    """Node in the knowledge graph"""
-
-    id: str
-    label: str
-    content: Optional[str] = None
-    group: int = Field(default=1, description="Node group/category")
-    size: float = Field(default=5, description="Node size based on importance")
-    color: Optional[str] = None
-    shape: str = Field(default="dot")
-    draw_order: Optional[int] = Field(
-        default=None, description="Order in which to draw this node"
-    )
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
-
-class GraphEdge(BaseModel):
-    """Edge in the knowledge graph"""
-
-    from_node: str = Field(..., alias="from")
-    to_node: str = Field(..., alias="to")
-    similarity: float = Field(..., ge=0, le=1, description="Similarity score")
-    width: Optional[float] = None
-    title: Optional[str] = None
-    draw_order: Optional[int] = Field(
-        default=None, description="Order in which to draw this edge"
-    )
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
-    class Config:
-        populate_by_name = True
-
-
-class GraphData(BaseModel):
-    """Complete graph data structure"""
-
-    nodes: List[GraphNode]
-    edges: List[GraphEdge]
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-
-
 class GraphQueryRequest(BaseModel):
     """Request for querying graph data"""
 
@@ -116,5 +77,5 @@ class GraphQueryRequest(BaseModel):
 class GraphQueryResponse(BaseModel):
     """Response for graph query"""
 
-    graph: GraphData
+    graph: KnowledgeGraphData
     query_metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -1,28 +1,145 @@
 """
 Orchestrates all analysis components
 """
-from typing import Dict
+import asyncio
+from typing import AsyncIterator, Callable, Dict, List, Tuple
 from datetime import datetime
 
+from app.analyzers.agency_analyzer import AgencyAnalyzer
+from app.core.config import settings
 from app.models.schemas import AnalysisResponse, DimensionScore
 
+# Scores a batch of article texts for one dimension, one score per text
+DimensionRunner = Callable[[List[str]], List[DimensionScore]]
+
 
 class AnalysisOrchestrator:
     def __init__(self):
-        # Analyzers will be initialized here
-        pass
-    
+        self.agency_analyzer = AgencyAnalyzer()
+
     async def analyze(self, article_data: Dict) -> AnalysisResponse:
         """
         Run comprehensive analysis on article
         """
-        # Placeholder implementation
+        # NLP analyzers are CPU-bound, so keep them off the event loop
+        dimensions = await asyncio.to_thread(
+            self._run_analyzers, article_data['content']
+        )
+
+        return self._build_response(article_data, dimensions)
+
+    async def analyze_stream(
+        self, article_data: Dict
+    ) -> AsyncIterator[Tuple[str, DimensionScore]]:
+        """
+        Run analyzers concurrently, yielding each dimension as soon as it finishes
+        """
+        text = article_data['content']
+        tasks = [
+            asyncio.create_task(self._run_dimension(name, runner, text))
+            for name, runner in self._dimension_runners().items()
+        ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # A client that disconnects mid-stream closes this generator early.
+            # Cancelling stops dimensions that haven't reached a worker thread;
+            # one already running there finishes and its result is dropped
+            for task in tasks:
+                task.cancel()
+
+    async def analyze_many(self, article_datas: List[Dict]) -> List[AnalysisResponse]:
+        """
+        Run analysis on several articles, batching them through the NLP pipeline
+        """
+        dimension_sets = await asyncio.to_thread(
+            self._run_analyzers_batch, [a['content'] for a in article_datas]
+        )
+
+        return [
+            self._build_response(article_data, dimensions)
+            for article_data, dimensions in zip(article_datas, dimension_sets)
+        ]
+
+    def _build_response(
+        self, article_data: Dict, dimensions: Dict[str, DimensionScore]
+    ) -> AnalysisResponse:
+        """
+        Assemble the analysis response for one article
+        """
         return AnalysisResponse(
             article_title=article_data['title'],
             analysis_timestamp=datetime.now(),
             overall_score=0.0,
-            dimensions={},
-            flags=[],
+            dimensions=dimensions,
+            flags=[flag for d in dimensions.values() for flag in d.flags],
             strengths=[],
             knowledge_graph_summary={}
         )
+
+    def _dimension_runners(self) -> Dict[str, DimensionRunner]:
+        """
+        Synchronous batch scoring function for each analysis dimension
+        """
+        return {'agency': self._agency_dimensions}
+
+    async def _run_dimension(
+        self, name: str, runner: DimensionRunner, text: str
+    ) -> Tuple[str, DimensionScore]:
+        """
+        Score one dimension in a worker thread
+        """
+        scores = await asyncio.to_thread(runner, [text])
+        return name, scores[0]
+
+    def _run_analyzers(self, text: str) -> Dict[str, DimensionScore]:
+        """
+        Run the synchronous analyzers on article text
+        """
+        return self._run_analyzers_batch([text])[0]
+
+    def _run_analyzers_batch(self, texts: List[str]) -> List[Dict[str, DimensionScore]]:
+        """
+        Run the synchronous analyzers on many article texts at once
+        """
+        scores = {
+            name: runner(texts) for name, runner in self._dimension_runners().items()
+        }
+        return [
+            {name: dimension_scores[i] for name, dimension_scores in scores.items()}
+            for i in range(len(texts))
+        ]
+
+    def _agency_dimensions(self, texts: List[str]) -> List[DimensionScore]:
+        """
+        Score agency erasure for each text in one batched spaCy pass
+        """
+        return [
+            self._agency_dimension(agency)
+            for agency in self.agency_analyzer.analyze_agency_batch(texts)
+        ]
+
+    def _agency_dimension(self, agency: Dict) -> DimensionScore:
+        """
+        Score agency erasure as the share of violent sentences written in the
+        passive voice, flagged above PASSIVE_VIOLENCE_THRESHOLD
+        """
+        statistics = agency['statistics']
+        passive_ratio = statistics['passive_violence_pct'] / 100
+
+        flags = []
+        if passive_ratio > settings.PASSIVE_VIOLENCE_THRESHOLD:
+            flags.append('passive_violence')
+        if self.agency_analyzer.nlp is None:
+            # Without the parser every count is zero; say so instead of
+            # reporting a clean score
+            flags.append('agency_model_unavailable')
+
+        return DimensionScore(
+            dimension='agency',
+            score=passive_ratio,
+            details=statistics,
+            flags=flags
+        )
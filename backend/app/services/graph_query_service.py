@@ -2,500 +2,598 @@
 Service for querying knowledge graph data
 """
 
-import networkx as nx
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from typing import AbstractSet, List, Optional, Dict, Any, Set, Tuple
+
+import numpy as np
 
 from app.models.graph_models import KnowledgeGraphData, GraphNode, GraphEdge
 from app.models.schemas import GraphQueryRequest
 
+# Define source nodes (dots) - matching Wikipedia references
+_SOURCE_NODES = (
+    GraphNode.model_construct(
+        id="source1",
+        label="Perkins (1986)",
+        content="Kenneth J. Perkins - Tunisia: Crossroads of the Islamic and European World",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=8,
+    ),
+    GraphNode.model_construct(
+        id="source2",
+        label="Wesseling (1996)",
+        content="Henk Wesseling - Divide and Rule: The Partition of Africa, 1880-1914",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=9,
+    ),
+    GraphNode.model_construct(
+        id="source3",
+        label="Ling (1960)",
+        content="Dwight L. Ling - The French Invasion of Tunisia, 1881",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=10,
+    ),
+    GraphNode.model_construct(
+        id="source4",
+        label="Aldrich (1996)",
+        content="Robert Aldrich - Greater France: A History of French Expansion",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=11,
+    ),
+    GraphNode.model_construct(
+        id="source5",
+        label="Ganiage (1985)",
+        content="Jean Ganiage - The Cambridge History of Africa",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=12,
+    ),
+    GraphNode.model_construct(
+        id="source6",
+        label="US Dept of State (1949)",
+        content="Territories Within the Area of Responsibility - Office of Near Eastern and African Affairs",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=13,
+    ),
+    GraphNode.model_construct(
+        id="source7",
+        label="Wade (1927)",
+        content="Herbert Treadwell Wade - The New International Year Book: Tunis under French foreign office",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=14,
+    ),
+    GraphNode.model_construct(
+        id="source8",
+        label="UN Territories (1950)",
+        content="Non-self-governing Territories - United Nations General Assembly Committee",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=15,
+    ),
+    GraphNode.model_construct(
+        id="source9",
+        label="Holt & Chilton (1918)",
+        content="Lucius Hudson Holt & Alexander Wheeler Chilton - A History of Europe",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=16,
+    ),
+    GraphNode.model_construct(
+        id="source10",
+        label="Balch (1909)",
+        content="Thomas William Balch - French Colonization in North Africa",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=17,
+    ),
+    GraphNode.model_construct(
+        id="source11",
+        label="Commercial Treaties (1931)",
+        content="Handbook of Commercial Treaties with Foreign Powers - His Majesty's Stationery Office",
+        group=4,
+        size=8,
+        color="#DC143C",
+        shape="dot",
+        draw_order=18,
+    ),
+    GraphNode.model_construct(
+        id="source12",
+        label="Arfaoui Khémais",
+        content="Arfaoui Khémais - Les élections politiques en Tunisie de 1881 à 1956, pp.45-51",
+        group=5,
+        size=8,
+        color="#28A745",
+        shape="dot",
+        draw_order=19,
+    ),
+)
+
+# Main article node
+_ARTICLE_NODE = GraphNode.model_construct(
+    id="article1",
+    label="French protectorate of Tunisia",
+    content="The French protectorate of Tunisia was established by the Treaty of Bardo in 1881",
+    group=1,
+    size=15,
+    color={"background": "#D4B896", "border": "#8B0000"},
+    shape="box",
+    borderWidth=3,
+    draw_order=1,
+)
+
+# Section nodes within the French Protectorate of Tunisia article
+_SECTION_NODES = (
+    GraphNode.model_construct(
+        id="section1",
+        label="Context",
+        content="Background of Tunisia before the protectorate and the Congress of Berlin",
+        group=1,
+        size=12,
+        color={"background": "#D4B896", "border": "#B22222"},
+        shape="box",
+        borderWidth=3,
+        draw_order=2,
+    ),
+    GraphNode.model_construct(
+        id="section2",
+        label="Conquest",
+        content="French military campaigns and the Treaty of Bardo in 1881",
+        group=1,
+        size=11,
+        color={"background": "#D4B896", "border": "#CD5C5C"},
+        shape="box",
+        borderWidth=3,
+        draw_order=3,
+    ),
+    GraphNode.model_construct(
+        id="section3",
+        label="Occupation",
+        content="French troops invasion and establishment of control over Tunisia",
+        group=1,
+        size=10,
+        color={"background": "#D4B896", "border": "#DC143C"},
+        shape="box",
+        borderWidth=3,
+        draw_order=4,
+    ),
+    GraphNode.model_construct(
+        id="section4",
+        label="Organisation and administration",
+        content="French administrative structure, local government, and judicial system under the protectorate",
+        group=1,
+        size=10,
+        color={"background": "#D4B896", "border": "#E9967A"},
+        shape="box",
+        borderWidth=3,
+        draw_order=5,
+    ),
+    GraphNode.model_construct(
+        id="section5",
+        label="World War II",
+        content="Tunisia during WWII, Vichy government, and deposing of Moncef Bey",
+        group=1,
+        size=9,
+        color={"background": "#D4B896", "border": "#F08080"},
+        shape="box",
+        borderWidth=3,
+        draw_order=6,
+    ),
+    GraphNode.model_construct(
+        id="section6",
+        label="Independence",
+        content="Nationalist movement, Habib Bourguiba, and independence in 1956",
+        group=1,
+        size=9,
+        color={"background": "#D4B896", "border": "#FF6347"},
+        shape="box",
+        borderWidth=3,
+        draw_order=7,
+    ),
+)
+
+_SAMPLE_NODES: Tuple[GraphNode, ...] = _SOURCE_NODES + (_ARTICLE_NODE,) + _SECTION_NODES
+
+# Define connections between article, sections, and sources
+_SAMPLE_EDGES: Tuple[GraphEdge, ...] = (
+    # Sources pointing to the main article and sections
+    GraphEdge.model_construct(
+        source="source1",
+        target="article1",
+        similarity=0.95,
+        width=1,
+        value=0.95,
+        title="Source: 0.95",
+        draw_order=8,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source2",
+        target="section1",
+        similarity=0.9,
+        width=1,
+        value=0.9,
+        title="Source: 0.90",
+        draw_order=9,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source3",
+        target="section2",
+        similarity=0.92,
+        width=1,
+        value=0.92,
+        title="Source: 0.92",
+        draw_order=10,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source4",
+        target="section6",
+        similarity=0.88,
+        width=1,
+        value=0.88,
+        title="Source: 0.88",
+        draw_order=11,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source5",
+        target="section3",
+        similarity=0.87,
+        width=1,
+        value=0.87,
+        title="Source: 0.87",
+        draw_order=12,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source6",
+        target="article1",
+        similarity=0.91,
+        width=1,
+        value=0.91,
+        title="Source: 0.91",
+        draw_order=13,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source7",
+        target="article1",
+        similarity=0.89,
+        width=1,
+        value=0.89,
+        title="Source: 0.89",
+        draw_order=14,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source8",
+        target="article1",
+        similarity=0.90,
+        width=1,
+        value=0.90,
+        title="Source: 0.90",
+        draw_order=15,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source9",
+        target="section1",
+        similarity=0.86,
+        width=1,
+        value=0.86,
+        title="Source: 0.86",
+        draw_order=16,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source10",
+        target="section4",
+        similarity=0.84,
+        width=1,
+        value=0.84,
+        title="Source: 0.84",
+        draw_order=17,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source11",
+        target="article1",
+        similarity=0.85,
+        width=1,
+        value=0.85,
+        title="Source: 0.85",
+        draw_order=18,
+        dashes=True,
+        arrows="to",
+    ),
+    GraphEdge.model_construct(
+        source="source12",
+        target="section4",
+        similarity=0.93,
+        width=1,
+        value=0.93,
+        title="Source: 0.93",
+        draw_order=19,
+        dashes=True,
+        arrows="to",
+    ),
+    # Article to sections
+    GraphEdge.model_construct(
+        source="article1",
+        target="section1",
+        similarity=0.95,
+        width=2,
+        value=0.95,
+        title="Contains section: 0.95",
+        draw_order=1,
+    ),
+    GraphEdge.model_construct(
+        source="article1",
+        target="section2",
+        similarity=0.9,
+        width=2,
+        value=0.9,
+        title="Contains section: 0.90",
+        draw_order=2,
+    ),
+    GraphEdge.model_construct(
+        source="article1",
+        target="section3",
+        similarity=0.88,
+        width=2,
+        value=0.88,
+        title="Contains section: 0.88",
+        draw_order=3,
+    ),
+    GraphEdge.model_construct(
+        source="article1",
+        target="section4",
+        similarity=0.85,
+        width=2,
+        value=0.85,
+        title="Contains section: 0.85",
+        draw_order=4,
+    ),
+    GraphEdge.model_construct(
+        source="article1",
+        target="section5",
+        similarity=0.82,
+        width=2,
+        value=0.82,
+        title="Contains section: 0.82",
+        draw_order=5,
+    ),
+    GraphEdge.model_construct(
+        source="article1",
+        target="section6",
+        similarity=0.8,
+        width=2,
+        value=0.8,
+        title="Contains section: 0.80",
+        draw_order=6,
+    ),
+    # Related sections - chronological flow
+    GraphEdge.model_construct(
+        source="section1",
+        target="section2",
+        similarity=0.85,
+        width=1,
+        value=0.85,
+        title="Led to: 0.85",
+        draw_order=13,
+    ),
+    GraphEdge.model_construct(
+        source="section2",
+        target="section3",
+        similarity=0.8,
+        width=1,
+        value=0.8,
+        title="Established: 0.80",
+        draw_order=14,
+    ),
+    GraphEdge.model_construct(
+        source="section3",
+        target="section4",
+        similarity=0.75,
+        width=1,
+        value=0.75,
+        title="Organized: 0.75",
+        draw_order=15,
+    ),
+    GraphEdge.model_construct(
+        source="section5",
+        target="section6",
+        similarity=0.9,
+        width=1,
+        value=0.9,
+        title="Resulted in: 0.90",
+        draw_order=16,
+    ),
+)
+
 
 class GraphQueryService:
     def __init__(self):
-        self.graph = nx.MultiDiGraph()
         self._nodes_cache: Dict[str, GraphNode] = {}
         self._edges_cache: List[GraphEdge] = []
+        # Dense integer index per node id, so traversal avoids string hashing;
+        # edge endpoints without a node get an index whose node is None
+        self._idx: Dict[str, int] = {}
+        self._nodes_by_idx: List[Optional[GraphNode]] = []
+        # Node index -> distinct successor then predecessor indices, so each
+        # undirected neighbor is visited once per hop
+        self._adj: List[Tuple[int, ...]] = []
+        # Node id -> positions in _edges_cache of the edges touching it
+        self._incident: Dict[str, List[int]] = defaultdict(list)
+        # Filter indices for get_nodes: group -> nodes, and lowercased text
+        self._nodes_by_group: Dict[int, Tuple[GraphNode, ...]] = {}
+        # Lowercased "label\x00content" per node; the separator keeps a topic
+        # from matching across the two fields
+        self._search_text: Dict[str, str] = {}
+        # Aggregates over the whole graph for get_full_graph metadata
+        self._total_similarity = 0.0
+        self._groups: List[int] = []
+        # Edge columns parallel to _edges_cache, for vectorized filters: endpoint
+        # node indices and similarities
+        self._edge_src = np.empty(0, dtype=np.int32)
+        self._edge_dst = np.empty(0, dtype=np.int32)
+        self._sim_arr = np.empty(0)
+        # Edge positions ordered by similarity, and the similarities in that order
+        self._sim_order = np.empty(0, dtype=np.intp)
+        self._sim_sorted = np.empty(0)
+        # Prebuilt answer for queries without node_ids
+        self._full_result: Optional[KnowledgeGraphData] = None
         self._initialize_sample_data()
+        # Result caches are per instance: lru_cache on the methods would key on
+        # self and keep every service and its indices alive for the process
+        self._query = lru_cache(maxsize=64)(self._query_uncached)
+        self._full_graph = lru_cache(maxsize=64)(self._full_graph_uncached)
+        self._neighbor_idx = lru_cache(maxsize=4096)(self._neighbor_idx_uncached)
 
     def _initialize_sample_data(self):
         """Initialize with French Protectorate of Tunisia article and its sections"""
-        # Define source nodes (dots) - matching Wikipedia references
-        sources = [
-            GraphNode(
-                id="source1",
-                label="Perkins (1986)",
-                content="Kenneth J. Perkins - Tunisia: Crossroads of the Islamic and European World",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=8,
-            ),
-            GraphNode(
-                id="source2",
-                label="Wesseling (1996)",
-                content="Henk Wesseling - Divide and Rule: The Partition of Africa, 1880-1914",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=9,
-            ),
-            GraphNode(
-                id="source3",
-                label="Ling (1960)",
-                content="Dwight L. Ling - The French Invasion of Tunisia, 1881",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=10,
-            ),
-            GraphNode(
-                id="source4",
-                label="Aldrich (1996)",
-                content="Robert Aldrich - Greater France: A History of French Expansion",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=11,
-            ),
-            GraphNode(
-                id="source5",
-                label="Ganiage (1985)",
-                content="Jean Ganiage - The Cambridge History of Africa",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=12,
-            ),
-            GraphNode(
-                id="source6",
-                label="US Dept of State (1949)",
-                content="Territories Within the Area of Responsibility - Office of Near Eastern and African Affairs",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=13,
-            ),
-            GraphNode(
-                id="source7",
-                label="Wade (1927)",
-                content="Herbert Treadwell Wade - The New International Year Book: Tunis under French foreign office",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=14,
-            ),
-            GraphNode(
-                id="source8",
-                label="UN Territories (1950)",
-                content="Non-self-governing Territories - United Nations General Assembly Committee",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=15,
-            ),
-            GraphNode(
-                id="source9",
-                label="Holt & Chilton (1918)",
-                content="Lucius Hudson Holt & Alexander Wheeler Chilton - A History of Europe",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=16,
-            ),
-            GraphNode(
-                id="source10",
-                label="Balch (1909)",
-                content="Thomas William Balch - French Colonization in North Africa",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=17,
-            ),
-            GraphNode(
-                id="source11",
-                label="Commercial Treaties (1931)",
-                content="Handbook of Commercial Treaties with Foreign Powers - His Majesty's Stationery Office",
-                group=4,
-                size=8,
-                color="#DC143C",
-                shape="dot",
-                draw_order=18,
-            ),
-            GraphNode(
-                id="source12",
-                label="Arfaoui Khémais",
-                content="Arfaoui Khémais - Les élections politiques en Tunisie de 1881 à 1956, pp.45-51",
-                group=5,
-                size=8,
-                color="#28A745",
-                shape="dot",
-                draw_order=19,
-            ),
-        ]
+        nodes_by_group: Dict[int, List[GraphNode]] = defaultdict(list)
+        for node in _SAMPLE_NODES:
+            self._nodes_cache[node.id] = node
+            self._idx[node.id] = len(self._nodes_by_idx)
+            self._nodes_by_idx.append(node)
+            nodes_by_group[node.group].append(node)
+            haystack = (node.label + "\x00" + (node.content or "")).lower()
+            self._search_text[node.id] = haystack
+        self._nodes_by_group = {g: tuple(ns) for g, ns in nodes_by_group.items()}
+
+        links = []
+        for edge in _SAMPLE_EDGES:
+            position = len(self._edges_cache)
+            self._incident[edge.source].append(position)
+            if edge.target != edge.source:
+                self._incident[edge.target].append(position)
+            self._edges_cache.append(edge)
+            for endpoint in (edge.source, edge.target):
+                if endpoint not in self._idx:
+                    self._idx[endpoint] = len(self._nodes_by_idx)
+                    self._nodes_by_idx.append(None)
+            links.append((self._idx[edge.source], self._idx[edge.target]))
+
+        succ: List[List[int]] = [[] for _ in self._nodes_by_idx]
+        pred: List[List[int]] = [[] for _ in self._nodes_by_idx]
+        for source, target in links:
+            succ[source].append(target)
+            pred[target].append(source)
+        self._adj = [tuple(dict.fromkeys(s + p)) for s, p in zip(succ, pred)]
+        self._edge_src = np.array([s for s, _ in links], dtype=np.int32)
+        self._edge_dst = np.array([t for _, t in links], dtype=np.int32)
+
+        self._total_similarity = sum(e.similarity for e in self._edges_cache)
+        self._groups = sorted(self._nodes_by_group)
+        self._sim_arr = np.fromiter(
+            (e.similarity for e in self._edges_cache),
+            dtype=np.float64,
+            count=len(self._edges_cache),
+        )
+        self._sim_order = np.argsort(self._sim_arr, kind="stable")
+        self._sim_sorted = self._sim_arr[self._sim_order]
 
-        # Main article node
-        article_node = GraphNode(
-            id="article1",
-            label="French protectorate of Tunisia",
-            content="The French protectorate of Tunisia was established by the Treaty of Bardo in 1881",
-            group=1,
-            size=15,
-            color={"background": "#D4B896", "border": "#8B0000"},
-            shape="box",
-            borderWidth=3,
-            draw_order=1,
+        self._full_result = KnowledgeGraphData(
+            nodes=list(self._nodes_cache.values()),
+            edges=self._edges_cache,
+            metadata={
+                "node_count": len(self._nodes_cache),
+                "edge_count": len(self._edges_cache),
+                "query_type": "full",
+            },
         )
 
-        # Section nodes within the French Protectorate of Tunisia article
-        section_nodes = [
-            GraphNode(
-                id="section1",
-                label="Context",
-                content="Background of Tunisia before the protectorate and the Congress of Berlin",
-                group=1,
-                size=12,
-                color={"background": "#D4B896", "border": "#B22222"},
-                shape="box",
-                borderWidth=3,
-                draw_order=2,
-            ),
-            GraphNode(
-                id="section2",
-                label="Conquest",
-                content="French military campaigns and the Treaty of Bardo in 1881",
-                group=1,
-                size=11,
-                color={"background": "#D4B896", "border": "#CD5C5C"},
-                shape="box",
-                borderWidth=3,
-                draw_order=3,
-            ),
-            GraphNode(
-                id="section3",
-                label="Occupation",
-                content="French troops invasion and establishment of control over Tunisia",
-                group=1,
-                size=10,
-                color={"background": "#D4B896", "border": "#DC143C"},
-                shape="box",
-                borderWidth=3,
-                draw_order=4,
-            ),
-            GraphNode(
-                id="section4",
-                label="Organisation and administration",
-                content="French administrative structure, local government, and judicial system under the protectorate",
-                group=1,
-                size=10,
-                color={"background": "#D4B896", "border": "#E9967A"},
-                shape="box",
-                borderWidth=3,
-                draw_order=5,
-            ),
-            GraphNode(
-                id="section5",
-                label="World War II",
-                content="Tunisia during WWII, Vichy government, and deposing of Moncef Bey",
-                group=1,
-                size=9,
-                color={"background": "#D4B896", "border": "#F08080"},
-                shape="box",
-                borderWidth=3,
-                draw_order=6,
-            ),
-            GraphNode(
-                id="section6",
-                label="Independence",
-                content="Nationalist movement, Habib Bourguiba, and independence in 1956",
-                group=1,
-                size=9,
-                color={"background": "#D4B896", "border": "#FF6347"},
-                shape="box",
-                borderWidth=3,
-                draw_order=7,
-            ),
-        ]
+    def _induced_edges(self, node_ids: AbstractSet[str]) -> List[GraphEdge]:
+        """Edges with both endpoints in node_ids, in cache order"""
+        positions = self._induced_positions(node_ids)
+        return [self._edges_cache[i] for i in positions.tolist()]
 
-        all_nodes = sources + [article_node] + section_nodes
+    def _induced_positions(self, node_ids: AbstractSet[str]) -> np.ndarray:
+        """Positions in _edges_cache of edges with both endpoints in node_ids"""
+        selected = np.fromiter(
+            (self._idx[n] for n in node_ids if n in self._idx), dtype=np.intp
+        )
+        member = np.zeros(len(self._nodes_by_idx), dtype=bool)
+        member[selected] = True
+        return np.flatnonzero(member[self._edge_src] & member[self._edge_dst])
 
-        for node in all_nodes:
-            self._nodes_cache[node.id] = node
-            self.graph.add_node(node.id, **node.model_dump())
-
-        # Define connections between article, sections, and sources
-        sample_edges = [
-            # Sources pointing to the main article and sections
-            GraphEdge(
-                source="source1",
-                target="article1",
-                similarity=0.95,
-                width=1,
-                value=0.95,
-                title="Source: 0.95",
-                draw_order=8,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source2",
-                target="section1",
-                similarity=0.9,
-                width=1,
-                value=0.9,
-                title="Source: 0.90",
-                draw_order=9,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source3",
-                target="section2",
-                similarity=0.92,
-                width=1,
-                value=0.92,
-                title="Source: 0.92",
-                draw_order=10,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source4",
-                target="section6",
-                similarity=0.88,
-                width=1,
-                value=0.88,
-                title="Source: 0.88",
-                draw_order=11,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source5",
-                target="section3",
-                similarity=0.87,
-                width=1,
-                value=0.87,
-                title="Source: 0.87",
-                draw_order=12,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source6",
-                target="article1",
-                similarity=0.91,
-                width=1,
-                value=0.91,
-                title="Source: 0.91",
-                draw_order=13,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source7",
-                target="article1",
-                similarity=0.89,
-                width=1,
-                value=0.89,
-                title="Source: 0.89",
-                draw_order=14,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source8",
-                target="article1",
-                similarity=0.90,
-                width=1,
-                value=0.90,
-                title="Source: 0.90",
-                draw_order=15,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source9",
-                target="section1",
-                similarity=0.86,
-                width=1,
-                value=0.86,
-                title="Source: 0.86",
-                draw_order=16,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source10",
-                target="section4",
-                similarity=0.84,
-                width=1,
-                value=0.84,
-                title="Source: 0.84",
-                draw_order=17,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source11",
-                target="article1",
-                similarity=0.85,
-                width=1,
-                value=0.85,
-                title="Source: 0.85",
-                draw_order=18,
-                dashes=True,
-                arrows="to",
-            ),
-            GraphEdge(
-                source="source12",
-                target="section4",
-                similarity=0.93,
-                width=1,
-                value=0.93,
-                title="Source: 0.93",
-                draw_order=19,
-                dashes=True,
-                arrows="to",
-            ),
-            # Article to sections
-            GraphEdge(
-                source="article1",
-                target="section1",
-                similarity=0.95,
-                width=2,
-                value=0.95,
-                title="Contains section: 0.95",
-                draw_order=1,
-            ),
-            GraphEdge(
-                source="article1",
-                target="section2",
-                similarity=0.9,
-                width=2,
-                value=0.9,
-                title="Contains section: 0.90",
-                draw_order=2,
-            ),
-            GraphEdge(
-                source="article1",
-                target="section3",
-                similarity=0.88,
-                width=2,
-                value=0.88,
-                title="Contains section: 0.88",
-                draw_order=3,
-            ),
-            GraphEdge(
-                source="article1",
-                target="section4",
-                similarity=0.85,
-                width=2,
-                value=0.85,
-                title="Contains section: 0.85",
-                draw_order=4,
-            ),
-            GraphEdge(
-                source="article1",
-                target="section5",
-                similarity=0.82,
-                width=2,
-                value=0.82,
-                title="Contains section: 0.82",
-                draw_order=5,
-            ),
-            GraphEdge(
-                source="article1",
-                target="section6",
-                similarity=0.8,
-                width=2,
-                value=0.8,
-                title="Contains section: 0.80",
-                draw_order=6,
-            ),
-            # Related sections - chronological flow
-            GraphEdge(
-                source="section1",
-                target="section2",
-                similarity=0.85,
-                width=1,
-                value=0.85,
-                title="Led to: 0.85",
-                draw_order=13,
-            ),
-            GraphEdge(
-                source="section2",
-                target="section3",
-                similarity=0.8,
-                width=1,
-                value=0.8,
-                title="Established: 0.80",
-                draw_order=14,
-            ),
-            GraphEdge(
-                source="section3",
-                target="section4",
-                similarity=0.75,
-                width=1,
-                value=0.75,
-                title="Organized: 0.75",
-                draw_order=15,
-            ),
-            GraphEdge(
-                source="section5",
-                target="section6",
-                similarity=0.9,
-                width=1,
-                value=0.9,
-                title="Resulted in: 0.90",
-                draw_order=16,
-            ),
-        ]
+    def query(self, request: GraphQueryRequest) -> KnowledgeGraphData:
+        """Execute a graph query"""
+        if request.node_ids is None:
+            return self._full_result
 
-        for edge in sample_edges:
-            self._edges_cache.append(edge)
-            self.graph.add_edge(edge.source, edge.target, **edge.model_dump())
+        return self._query(
+            tuple(request.node_ids), request.include_neighbors, request.max_depth
+        )
 
-    async def query(self, request: GraphQueryRequest) -> KnowledgeGraphData:
-        """Execute a graph query"""
+    def _query_uncached(
+        self, node_ids: Tuple[str, ...], include_neighbors: bool, max_depth: int
+    ) -> KnowledgeGraphData:
+        """Execute a filtered query for normalized request fields; cached by _query"""
+        # An explicit empty list selects nothing rather than the whole graph
         nodes = []
-        edges = []
-
-        if request.node_ids:
-            # Filter by specific node IDs
-            for node_id in request.node_ids:
-                if node_id in self._nodes_cache:
-                    nodes.append(self._nodes_cache[node_id])
-
-            if request.include_neighbors:
-                # Add neighbors
-                for node_id in request.node_ids:
-                    neighbors = await self.get_neighbors(node_id, request.max_depth)
-                    nodes.extend(neighbors)
-
-            # Get relevant edges
-            node_id_set = {n.id for n in nodes}
-            edges = [
-                e
-                for e in self._edges_cache
-                if e.source in node_id_set and e.target in node_id_set
-            ]
-        else:
-            # Return all nodes and edges
-            nodes = list(self._nodes_cache.values())
-            edges = self._edges_cache
-
-        # Remove duplicates
-        unique_nodes = {n.id: n for n in nodes}
-        nodes = list(unique_nodes.values())
+        seen_ids: Set[str] = set()
+        get_node = self._nodes_cache.get
+
+        # Filter by specific node IDs
+        for node_id in node_ids:
+            node = get_node(node_id)
+            if node is not None and node_id not in seen_ids:
+                seen_ids.add(node_id)
+                nodes.append(node)
+
+        if include_neighbors:
+            # Add neighbors with one traversal seeded from every requested node
+            nodes_by_idx = self._nodes_by_idx
+            starts = [self._idx[n.id] for n in nodes]
+            for i in self._bfs_idx(starts, max_depth):
+                node = nodes_by_idx[i]
+                if node is not None:
+                    seen_ids.add(node.id)
+                    nodes.append(node)
+
+        # Get relevant edges
+        edges = self._induced_edges(seen_ids)
 
         return KnowledgeGraphData(
             nodes=nodes,
@@ -503,101 +601,133 @@ class GraphQueryService:
             metadata={
                 "node_count": len(nodes),
                 "edge_count": len(edges),
-                "query_type": "filtered" if request.node_ids else "full",
+                "query_type": "filtered",
             },
         )
 
-    async def get_nodes(
+    def get_nodes(
         self, topic: Optional[str] = None, group: Optional[int] = None, limit: int = 100
     ) -> List[GraphNode]:
         """Get filtered list of nodes"""
-        nodes = list(self._nodes_cache.values())
-
         if group is not None:
-            nodes = [n for n in nodes if n.group == group]
+            nodes = self._nodes_by_group.get(group, ())
+            if not topic:
+                return list(nodes[:limit])
+        else:
+            nodes = self._nodes_cache.values()
 
         if topic:
-            nodes = [
-                n
-                for n in nodes
-                if topic.lower() in n.label.lower()
-                or (n.content and topic.lower() in n.content.lower())
-            ]
+            topic_lc = topic.lower()
+            if "\x00" in topic_lc:
+                # Only a match spanning label and content could contain the
+                # separator, and the fields are matched separately
+                return []
+            nodes = (n for n in nodes if topic_lc in self._search_text[n.id])
 
-        return nodes[:limit]
+        return list(islice(nodes, limit))
 
-    async def get_node_by_id(self, node_id: str) -> Optional[GraphNode]:
+    def get_node_by_id(self, node_id: str) -> Optional[GraphNode]:
         """Get a specific node by ID"""
         return self._nodes_cache.get(node_id)
 
-    async def get_neighbors(self, node_id: str, max_depth: int = 1) -> List[GraphNode]:
+    def get_neighbors(self, node_id: str, max_depth: int = 1) -> List[GraphNode]:
         """Get neighboring nodes up to max_depth"""
-        if node_id not in self.graph:
-            return []
-
-        neighbors_ids = set()
-        current_level = {node_id}
-
-        for _ in range(max_depth):
-            next_level = set()
-            for node in current_level:
-                # Get successors and predecessors
-                next_level.update(self.graph.successors(node))
-                next_level.update(self.graph.predecessors(node))
+        nodes_by_idx = self._nodes_by_idx
+        return [
+            nodes_by_idx[i]
+            for i in self._neighbor_idx(node_id, max_depth)
+            if nodes_by_idx[i] is not None
+        ]
 
-            neighbors_ids.update(next_level)
-            current_level = next_level
+    def _neighbor_idx_uncached(self, node_id: str, max_depth: int) -> Tuple[int, ...]:
+        """Indices within max_depth hops in BFS order; cached by _neighbor_idx"""
+        if node_id not in self._nodes_cache:
+            return ()
 
-        # Remove the original node
-        neighbors_ids.discard(node_id)
+        return tuple(self._bfs_idx([self._idx[node_id]], max_depth))
 
-        return [
-            self._nodes_cache[nid] for nid in neighbors_ids if nid in self._nodes_cache
-        ]
+    def _bfs_idx(self, starts: List[int], max_depth: int) -> List[int]:
+        """Indices within max_depth hops of any start, excluding the starts"""
+        adj = self._adj
+        visited = bytearray(len(adj))
+        for start in starts:
+            visited[start] = 1
+        found = []
+        frontier = starts
 
-    async def get_edges(
+        for _ in range(max_depth):
+            next_frontier = []
+            for u in frontier:
+                # Successors and predecessors
+                for v in adj[u]:
+                    if not visited[v]:
+                        visited[v] = 1
+                        next_frontier.append(v)
+            found.extend(next_frontier)
+            frontier = next_frontier
+
+        return found
+
+    def get_edges(
         self,
         node_id: Optional[str] = None,
         min_similarity: float = 0.0,
         limit: int = 100,
     ) -> List[GraphEdge]:
         """Get filtered list of edges"""
-        edges = self._edges_cache
+        if min_similarity > 0:
+            if node_id:
+                positions = np.array(self._incident.get(node_id, ()), dtype=np.intp)
+                positions = positions[self._sim_arr[positions] >= min_similarity]
+            else:
+                # Binary search for the cutoff, then restore cache order
+                cutoff = np.searchsorted(self._sim_sorted, min_similarity, side="left")
+                positions = np.sort(self._sim_order[cutoff:])
+            return [self._edges_cache[i] for i in positions[:limit].tolist()]
 
         if node_id:
-            edges = [e for e in edges if e.source == node_id or e.target == node_id]
+            positions = self._incident.get(node_id, ())
+            return [self._edges_cache[i] for i in islice(positions, limit)]
 
-        if min_similarity > 0:
-            edges = [e for e in edges if e.similarity >= min_similarity]
+        return self._edges_cache[:limit]
 
-        return edges[:limit]
-
-    async def get_full_graph(
+    def get_full_graph(
         self, topic: Optional[str] = None, include_metadata: bool = True
     ) -> KnowledgeGraphData:
         """Get complete graph"""
-        nodes = await self.get_nodes(topic=topic, limit=1000)
+        return self._full_graph(topic, include_metadata)
+
+    def _full_graph_uncached(
+        self, topic: Optional[str], include_metadata: bool
+    ) -> KnowledgeGraphData:
+        """Build the complete or topic-filtered graph; cached by _full_graph"""
+        nodes = self.get_nodes(topic=topic, limit=1000)
 
         if topic:
             # Filter edges to only include nodes in result
-            node_ids = {n.id for n in nodes}
-            edges = [
-                e
-                for e in self._edges_cache
-                if e.source in node_ids and e.target in node_ids
-            ]
+            positions = self._induced_positions(frozenset(n.id for n in nodes))
+            edges = [self._edges_cache[i] for i in positions.tolist()]
         else:
+            positions = None
             edges = self._edges_cache
 
         metadata = {}
         if include_metadata:
+            if len(nodes) == len(self._nodes_cache):
+                groups = self._groups
+            else:
+                groups = sorted({n.group for n in nodes})
+            if positions is None:
+                total_similarity = self._total_similarity
+            else:
+                # Sum in Python order so the average matches the unindexed result
+                total_similarity = sum(self._sim_arr[positions].tolist())
+
             metadata = {
                 "node_count": len(nodes),
                 "edge_count": len(edges),
-                "groups": list({n.group for n in nodes}),
-                "avg_similarity": sum(e.similarity for e in edges) / len(edges)
-                if edges
-                else 0,
+                "groups": groups,
+                "avg_similarity": total_similarity / len(edges) if edges else 0,
             }
 
         return KnowledgeGraphData(nodes=nodes, edges=edges, metadata=metadata)
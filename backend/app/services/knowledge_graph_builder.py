@@ -2,16 +2,50 @@
 Service for building knowledge graphs from article data
 """
 
-import networkx as nx
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+from async_lru import alru_cache
 
 from app.models.graph_models import KnowledgeGraphData, GraphNode, GraphEdge
 
+# Placeholder graph pieces built once from trusted literals; only the article
+# node varies per request and is copied with the title filled in
+_ARTICLE_NODE = GraphNode.model_construct(
+    id="concept1",
+    label="",
+    group=1,
+    size=15,
+    color="#4285F4",
+    shape="dot",
+)
+
+_RELATED_NODE = GraphNode.model_construct(
+    id="concept2",
+    label="Related Concept",
+    content="A related concept from the article",
+    group=2,
+    size=10,
+    color="#34A853",
+    shape="dot",
+)
+
+_RELATED_EDGE = GraphEdge.model_construct(
+    source="concept1",
+    target="concept2",
+    similarity=0.75,
+    width=2.25,
+    value=0.75,
+    title="Similarity: 0.75",
+)
+
 
 class KnowledgeGraphBuilder:
     def __init__(self):
-        self.graph = nx.MultiDiGraph()
         self.node_counter = 0
+        # Per instance, so the cache does not key on self and pin the builder
+        self._build_from_article = alru_cache(maxsize=256)(
+            self._build_from_article_uncached
+        )
 
     def build_graph(self, article_data: Dict) -> KnowledgeGraphData:
         """
@@ -34,40 +68,23 @@ class KnowledgeGraphBuilder:
         """
         Build knowledge graph from Wikipedia article
         """
+        return await self._build_from_article(article_title, tuple(languages))
+
+    async def _build_from_article_uncached(
+        self, article_title: str, languages: Tuple[str, ...]
+    ) -> KnowledgeGraphData:
+        """
+        Build the graph for one article and language tuple; cached by
+        _build_from_article
+        """
         # Placeholder implementation - would fetch and process article
         # For now, return sample graph structure
 
-        nodes = [
-            GraphNode(
-                id="concept1",
-                label=article_title,
-                content=f"Main article: {article_title}",
-                group=1,
-                size=15,
-                color="#4285F4",
-                shape="dot",
-            ),
-            GraphNode(
-                id="concept2",
-                label="Related Concept",
-                content="A related concept from the article",
-                group=2,
-                size=10,
-                color="#34A853",
-                shape="dot",
-            ),
-        ]
-
-        edges = [
-            GraphEdge(
-                source="concept1",
-                target="concept2",
-                similarity=0.75,
-                width=2.25,
-                value=0.75,
-                title="Similarity: 0.75",
-            )
-        ]
+        article_node = _ARTICLE_NODE.model_copy(
+            update={"label": article_title, "content": f"Main article: {article_title}"}
+        )
+        nodes = [article_node, _RELATED_NODE]
+        edges = [_RELATED_EDGE]
 
         return KnowledgeGraphData(
             nodes=nodes,
@@ -76,6 +93,6 @@ class KnowledgeGraphBuilder:
                 "node_count": len(nodes),
                 "edge_count": len(edges),
                 "article_title": article_title,
-                "languages": languages,
+                "languages": list(languages),
             },
         )
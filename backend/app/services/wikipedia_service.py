@@ -1,11 +1,17 @@
 """
 Service for fetching and parsing Wikipedia articles
 """
+import asyncio
+import re
 import wikipediaapi
 import mwparserfromhell
-from typing import Dict, List, Optional
+from async_lru import alru_cache
+from typing import Dict, List, Optional, Tuple
 from app.core.config import settings
 
+# Counting matches avoids materialising a token list the size of the article
+_WORD_RE = re.compile(r'\S+')
+
 
 class WikipediaService:
     def __init__(self):
@@ -14,11 +20,31 @@ class WikipediaService:
             extract_format=wikipediaapi.ExtractFormat.WIKI,
             user_agent=settings.WIKIPEDIA_USER_AGENT
         )
+        # Caches are per instance: alru_cache on the methods would key on self
+        # and keep every service alive for the life of the process
+        self._fetch_article = alru_cache(maxsize=512, ttl=3600)(
+            self._fetch_article_uncached
+        )
+        self._article_info = alru_cache(maxsize=2048, ttl=86400)(
+            self._article_info_uncached
+        )
+        self._available_languages = alru_cache(maxsize=2048, ttl=86400)(
+            self._available_languages_uncached
+        )
     
     async def fetch_article(self, title: str, languages: List[str]) -> Dict:
         """
         Fetch article content, references, and cross-language versions
         """
+        # Normalize languages into a hashable, order-independent cache key
+        return await self._fetch_article(title, tuple(sorted(languages)))
+    
+    async def _fetch_article_uncached(
+        self, title: str, languages: Tuple[str, ...]
+    ) -> Dict:
+        """
+        Fetch article data for a normalized language tuple; cached by _fetch_article
+        """
         article_data = {
             'title': title,
             'content': '',
@@ -37,27 +63,47 @@ class WikipediaService:
         """
         Get basic article information
         """
+        return await self._article_info(title)
+    
+    async def _article_info_uncached(self, title: str) -> Dict:
+        """
+        Look up article information; cached by _article_info
+        """
         page = self.wiki_en.page(title)
         
-        if not page.exists():
+        # wikipediaapi fetches lazily over blocking HTTP, so keep it off the loop
+        if not await asyncio.to_thread(page.exists):
             raise ValueError(f"Article '{title}' not found")
         
+        # The page object and its HTTP session aren't thread-safe, so load both
+        # lazy attributes from a single worker thread
+        text, langlinks = await asyncio.to_thread(
+            lambda: (page.text, page.langlinks)
+        )
+        
         return {
             'title': page.title,
             'page_id': page.pageid,
             'url': page.fullurl,
             'summary': page.summary,
-            'word_count': len(page.text.split()),
-            'available_languages': list(page.langlinks.keys())
+            'word_count': sum(1 for _ in _WORD_RE.finditer(text)),
+            'available_languages': list(langlinks.keys())
         }
     
     async def get_available_languages(self, title: str) -> List[str]:
         """
         Get available language versions
         """
+        return await self._available_languages(title)
+    
+    async def _available_languages_uncached(self, title: str) -> List[str]:
+        """
+        Look up available language versions; cached by _available_languages
+        """
         page = self.wiki_en.page(title)
         
-        if not page.exists():
+        if not await asyncio.to_thread(page.exists):
             raise ValueError(f"Article '{title}' not found")
         
-        return list(page.langlinks.keys())
+        langlinks = await asyncio.to_thread(lambda: page.langlinks)
+        return list(langlinks.keys())
@@ -0,0 +1,113 @@
+"""
+Tests for the agency analyzer, using hand-annotated docs instead of a model
+"""
+
+import spacy
+from spacy.tokens import Doc
+
+from app.analyzers.agency_analyzer import AgencyAnalyzer
+
+# English lexical attributes, so Token.lower_ is filled in as a model would
+VOCAB = spacy.blank("en").vocab
+
+
+def _doc(words, heads, deps, pos):
+    spaces = [True] * (len(words) - 1) + [False]
+    return Doc(VOCAB, words=words, spaces=spaces, heads=heads, deps=deps, pos=pos)
+
+
+def _analyze(analyzer, doc):
+    result = analyzer._new_result()
+    found = analyzer._scan_terms(doc.text.lower())
+    analyzer._analyze_sentence(doc, found, result)
+    return result
+
+
+def test_passive_violence_with_agent():
+    analyzer = AgencyAnalyzer()
+    doc = _doc(
+        ["Villages", "were", "burned", "by", "French", "troops", "."],
+        [2, 2, 2, 2, 5, 3, 2],
+        ["nsubjpass", "auxpass", "ROOT", "agent", "amod", "pobj", "punct"],
+        ["NOUN", "AUX", "VERB", "ADP", "ADJ", "NOUN", "PUNCT"],
+    )
+
+    result = _analyze(analyzer, doc)
+
+    assert result["counts"]["passive_violence"] == 1
+    assert result["counts"]["agent_deletion"] == 0
+    assert result["patterns"]["passive_violence"] == [
+        {"text": doc.text, "actor": "troops"}
+    ]
+
+
+def test_passive_violence_without_agent_is_agent_deletion():
+    analyzer = AgencyAnalyzer()
+    doc = _doc(
+        ["Villagers", "were", "killed", "."],
+        [2, 2, 2, 2],
+        ["nsubjpass", "auxpass", "ROOT", "punct"],
+        ["NOUN", "AUX", "VERB", "PUNCT"],
+    )
+
+    result = _analyze(analyzer, doc)
+
+    assert result["counts"]["passive_violence"] == 1
+    assert result["counts"]["agent_deletion"] == 1
+    assert result["patterns"]["passive_violence"] == [{"text": doc.text, "actor": None}]
+    assert result["patterns"]["agent_deletion"] == [
+        {"text": doc.text, "type": "violence"}
+    ]
+
+
+def test_active_resistance():
+    analyzer = AgencyAnalyzer()
+    doc = _doc(
+        ["The", "rebels", "resisted", "the", "occupation", "."],
+        [1, 2, 2, 4, 2, 2],
+        ["det", "nsubj", "ROOT", "det", "dobj", "punct"],
+        ["DET", "NOUN", "VERB", "DET", "NOUN", "PUNCT"],
+    )
+
+    result = _analyze(analyzer, doc)
+
+    assert result["patterns"]["active_resistance"] == [{"text": doc.text}]
+    assert result["counts"]["passive_violence"] == 0
+    assert result["counts"]["native_active_violence"] == 0
+
+
+def test_native_actor_as_subject_of_violence():
+    analyzer = AgencyAnalyzer()
+    doc = _doc(
+        ["The", "rebels", "attacked", "the", "soldiers", "."],
+        [1, 2, 2, 4, 2, 2],
+        ["det", "nsubj", "ROOT", "det", "dobj", "punct"],
+        ["DET", "NOUN", "VERB", "DET", "NOUN", "PUNCT"],
+    )
+
+    result = _analyze(analyzer, doc)
+
+    assert result["counts"]["native_active_violence"] == 1
+    assert result["counts"]["passive_violence"] == 0
+    # "attacked" is also a resistance term, so the active sentence counts there
+    assert result["patterns"]["active_resistance"] == [{"text": doc.text}]
+
+
+def test_prefilter_counts_violence_and_collects_nominalizations():
+    analyzer = AgencyAnalyzer()
+    doc = analyzer.nlp_sbd(
+        "Villages were burned. Violence occurred in the town. "
+        "The rebels resisted. The market opened."
+    )
+    result = analyzer._new_result()
+
+    candidates = analyzer._prefilter_sentences(doc, result)
+
+    assert result["counts"]["violence"] == 1
+    assert [text for text, _ in candidates] == [
+        "Villages were burned.",
+        "The rebels resisted.",
+    ]
+    assert result["patterns"]["nominalization"] == [
+        {"text": "Violence occurred in the town.", "pattern": "violence occurred"}
+    ]
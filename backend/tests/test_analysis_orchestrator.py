@@ -0,0 +1,65 @@
+"""
+Tests for the analysis orchestrator
+"""
+import asyncio
+
+from app.services.analysis_orchestrator import AnalysisOrchestrator
+
+
+def _statistics(passive_violence_pct):
+    return {
+        'total_violence_references': 10,
+        'passive_violence_pct': passive_violence_pct,
+        'agent_deletion_pct': 0.0,
+        'native_active_violence_pct': 0.0
+    }
+
+
+def test_agency_score_is_passive_violence_share():
+    orchestrator = AnalysisOrchestrator()
+    orchestrator.agency_analyzer.nlp = object()
+    
+    dimension = orchestrator._agency_dimension(
+        {'patterns': {}, 'statistics': _statistics(40.0)}
+    )
+    
+    assert dimension.dimension == 'agency'
+    assert dimension.score == 0.4
+    assert dimension.details == _statistics(40.0)
+    assert dimension.flags == ['passive_violence']
+
+
+def test_agency_flag_needs_share_above_threshold():
+    orchestrator = AnalysisOrchestrator()
+    orchestrator.agency_analyzer.nlp = object()
+    
+    dimension = orchestrator._agency_dimension(
+        {'patterns': {}, 'statistics': _statistics(30.0)}
+    )
+    
+    assert dimension.flags == []
+
+
+def test_missing_model_is_flagged():
+    orchestrator = AnalysisOrchestrator()
+    orchestrator.agency_analyzer.nlp = None
+    
+    response = asyncio.run(
+        orchestrator.analyze({'title': 'T', 'content': 'Villages were burned.'})
+    )
+    
+    assert response.dimensions['agency'].score == 0.0
+    assert response.flags == ['agency_model_unavailable']
+
+
+def test_analyze_many_scores_each_article():
+    orchestrator = AnalysisOrchestrator()
+    articles = [
+        {'title': 'A', 'content': 'Villages were burned.'},
+        {'title': 'B', 'content': ''}
+    ]
+    
+    responses = asyncio.run(orchestrator.analyze_many(articles))
+    
+    assert [r.article_title for r in responses] == ['A', 'B']
+    assert all('agency' in r.dimensions for r in responses)
@@ -0,0 +1,44 @@
+"""
+Tests for the analysis endpoints
+"""
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def _events(body):
+    return [block for block in body.split('\n\n') if block]
+
+
+def test_stream_sends_one_event_per_dimension():
+    with TestClient(app) as client:
+        response = client.post(
+            '/api/v1/analyze/stream', json={'article_title': 'Tunisia'}
+        )
+    
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/event-stream')
+    events = _events(response.text)
+    assert len(events) == 1
+    assert events[0].startswith('data: ')
+    payload = json.loads(events[0][len('data: '):])
+    assert payload['agency']['dimension'] == 'agency'
+
+
+def test_stream_reports_a_failing_dimension_as_an_error_event():
+    def fail(texts):
+        raise RuntimeError('analyzer crashed')
+    
+    with TestClient(app) as client:
+        orchestrator = app.state.analysis_orchestrator
+        orchestrator._dimension_runners = lambda: {'agency': fail}
+        response = client.post(
+            '/api/v1/analyze/stream', json={'article_title': 'Tunisia'}
+        )
+    
+    assert response.status_code == 200
+    assert _events(response.text) == [
+        'event: error\ndata: {"detail": "analyzer crashed"}'
+    ]
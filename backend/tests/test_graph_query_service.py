@@ -0,0 +1,170 @@
+"""
+Tests for the graph query service
+"""
+
+import gc
+import weakref
+
+import pytest
+
+from app.models.schemas import GraphQueryRequest
+from app.services.graph_query_service import GraphQueryService
+
+
+def test_cached_results_do_not_outlive_the_service():
+    service = GraphQueryService()
+    full = service.get_full_graph(topic="tunisia")
+    filtered = service.query(
+        GraphQueryRequest(node_ids=["article1"], include_neighbors=True)
+    )
+
+    assert service.get_full_graph(topic="tunisia") is full
+    assert (
+        service.query(GraphQueryRequest(node_ids=["article1"], include_neighbors=True))
+        is filtered
+    )
+    assert service.get_neighbors("article1", 2)
+    assert service._neighbor_idx("article1", 2) is service._neighbor_idx("article1", 2)
+
+    ref = weakref.ref(service)
+    del service
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_topic_does_not_match_across_label_and_content():
+    service = GraphQueryService()
+    label_and_content = "sia\x00the"
+
+    assert service.get_nodes(topic="tunisia")
+    assert service.get_nodes(topic=label_and_content) == []
+    assert service.get_nodes(topic=label_and_content, group=1) == []
+    assert service.get_full_graph(topic=label_and_content).nodes == []
+
+
+def _ids(items):
+    return [item.id for item in items]
+
+
+def _pairs(edges):
+    return [(e.source, e.target) for e in edges]
+
+
+def test_query_without_node_ids_returns_full_graph():
+    service = GraphQueryService()
+
+    graph = service.query(GraphQueryRequest(node_ids=None))
+
+    assert len(graph.nodes) == 19
+    assert len(graph.edges) == 22
+    assert graph.metadata["query_type"] == "full"
+
+
+def test_query_with_empty_node_ids_selects_nothing():
+    service = GraphQueryService()
+
+    graph = service.query(GraphQueryRequest(node_ids=[]))
+
+    assert graph.nodes == []
+    assert graph.edges == []
+    assert graph.metadata == {
+        "node_count": 0,
+        "edge_count": 0,
+        "query_type": "filtered",
+    }
+
+
+def test_query_expands_neighbors_from_every_requested_node():
+    service = GraphQueryService()
+
+    graph = service.query(
+        GraphQueryRequest(node_ids=["section2", "source1"], include_neighbors=True)
+    )
+
+    assert _ids(graph.nodes)[:2] == ["section2", "source1"]
+    assert set(_ids(graph.nodes)) == {
+        "section2",
+        "source1",
+        "article1",
+        "section1",
+        "section3",
+        "source3",
+    }
+    assert len(graph.edges) == 7
+
+    deeper = service.query(
+        GraphQueryRequest(
+            node_ids=["section2", "source1"], include_neighbors=True, max_depth=2
+        )
+    )
+
+    assert len(deeper.nodes) == 16
+    assert len(deeper.edges) == 19
+
+
+def test_get_nodes_filters_by_group_topic_and_limit():
+    service = GraphQueryService()
+
+    assert _ids(service.get_nodes(group=4, limit=3)) == [
+        "source1",
+        "source2",
+        "source3",
+    ]
+    assert service.get_nodes(group=2) == []
+    assert _ids(service.get_nodes(topic="FRENCH", limit=4)) == [
+        "source3",
+        "source4",
+        "source7",
+        "source10",
+    ]
+    assert _ids(service.get_nodes(topic="tunisia", group=1)) == [
+        "article1",
+        "section1",
+        "section3",
+        "section5",
+    ]
+    assert service.get_nodes(limit=0) == []
+
+
+def test_get_edges_filters_by_node_and_inclusive_min_similarity():
+    service = GraphQueryService()
+
+    assert len(service.get_edges(node_id="article1")) == 11
+    # 0.9 is a stored similarity, so edges at exactly 0.9 must be kept
+    assert _pairs(service.get_edges(node_id="article1", min_similarity=0.9)) == [
+        ("source1", "article1"),
+        ("source6", "article1"),
+        ("source8", "article1"),
+        ("article1", "section1"),
+        ("article1", "section2"),
+    ]
+    strong = service.get_edges(min_similarity=0.9)
+    assert len(strong) == 9
+    assert min(e.similarity for e in strong) == 0.9
+    assert len(service.get_edges(min_similarity=0.9, limit=2)) == 2
+
+
+def test_topic_full_graph_metadata_covers_only_matching_nodes():
+    service = GraphQueryService()
+
+    graph = service.get_full_graph(topic="tunisia")
+
+    assert sorted(_ids(graph.nodes)) == [
+        "article1",
+        "section1",
+        "section3",
+        "section5",
+        "source1",
+        "source3",
+    ]
+    assert graph.metadata["node_count"] == 6
+    assert graph.metadata["edge_count"] == 4
+    assert graph.metadata["groups"] == [1, 4]
+    assert graph.metadata["avg_similarity"] == pytest.approx(0.9)
+
+    full = service.get_full_graph()
+
+    assert full.metadata["groups"] == [1, 4, 5]
+    assert full.metadata["avg_similarity"] == pytest.approx(0.8727272727)
+    assert service.get_full_graph(include_metadata=False).metadata == {}
@@ -0,0 +1,30 @@
+"""
+Tests for the knowledge graph builder
+"""
+
+import asyncio
+import gc
+import weakref
+
+from app.services.knowledge_graph_builder import KnowledgeGraphBuilder
+
+
+def test_builds_are_cached_without_pinning_the_builder():
+    builder = KnowledgeGraphBuilder()
+
+    async def builds():
+        first = await builder.build_from_article("Tunisia", ["en", "fr"])
+        second = await builder.build_from_article("Tunisia", ["en", "fr"])
+        return first, second
+
+    first, second = asyncio.run(builds())
+
+    assert first is second
+    assert first.nodes[0].label == "Tunisia"
+    assert first.metadata["languages"] == ["en", "fr"]
+
+    ref = weakref.ref(builder)
+    del builder
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,31 @@
+"""
+Tests for the colonial language detector
+"""
+from app.analyzers.language_analyzer import ColonialLanguageDetector
+
+
+def test_positions_index_original_text():
+    text = 'The Tribe was called primitive.'
+    findings = ColonialLanguageDetector().analyze_language(text)
+    
+    assert [(f['term'], f['position']) for f in findings] == [
+        ('tribe', 4),
+        ('primitive', 21)
+    ]
+
+
+def test_positions_survive_length_changing_lowercase():
+    # "İ".lower() is two code points, which used to shift every later offset
+    text = 'İİ the Tribe was primitive'
+    findings = ColonialLanguageDetector().analyze_language(text)
+    
+    assert [f['term'] for f in findings] == ['tribe', 'primitive']
+    for finding in findings:
+        start = finding['position']
+        assert text[start:start + len(finding['term'])].lower() == finding['term']
+
+
+def test_only_matches_at_word_start():
+    findings = ColonialLanguageDetector().analyze_language('a diatribe')
+    
+    assert findings == []
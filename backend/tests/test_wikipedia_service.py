@@ -0,0 +1,46 @@
+"""
+Tests for the Wikipedia service
+"""
+import asyncio
+import gc
+import weakref
+
+from app.services.wikipedia_service import WikipediaService
+
+
+class FakePage:
+    title = 'Tunisia'
+    pageid = 1
+    fullurl = 'https://en.wikipedia.org/wiki/Tunisia'
+    summary = 'A country'
+    text = 'A country in  North\nAfrica'
+    langlinks = {'fr': None, 'ar': None}
+    
+    def exists(self):
+        return True
+
+
+def test_lookups_are_cached_without_pinning_the_service():
+    service = WikipediaService()
+    fetched = []
+    service.wiki_en.page = lambda title: fetched.append(title) or FakePage()
+    
+    async def lookups():
+        first = await service.get_article_info('Tunisia')
+        second = await service.get_article_info('Tunisia')
+        languages = await service.get_available_languages('Tunisia')
+        await service.get_available_languages('Tunisia')
+        return first, second, languages
+    
+    first, second, languages = asyncio.run(lookups())
+    
+    assert first is second
+    assert first['word_count'] == 5
+    assert languages == ['fr', 'ar']
+    assert fetched == ['Tunisia', 'Tunisia']
+    
+    ref = weakref.ref(service)
+    del service
+    gc.collect()
+    
+    assert ref() is None